@@ -15,6 +15,8 @@ import aiofiles
 import torch
 import torchaudio
 from scipy.io import wavfile
+from functools import lru_cache
+from scipy.signal import firwin, resample_poly
 from botocore.exceptions import BotoCoreError, ClientError
 from aiobotocore.session import AioSession
 from contextlib import AsyncExitStack
@@ -357,14 +359,28 @@ def yield_chunks_from_memory(audio_bytes, chunk_size=512):
 
 
 def pcm_to_wav_bytes(pcm_data, sample_rate=16000, num_channels=1, sample_width=2):
-    buffer = io.BytesIO()
-    bit_depth = 16 
-    if len(pcm_data)%2 == 1:
+    # Write the int16 frames straight into the container; no float round-trip needed
+    if len(pcm_data) % 2 == 1:
         pcm_data += b'\x00'
-    tensor_pcm = torch.frombuffer(pcm_data, dtype=torch.int16)
-    tensor_pcm = tensor_pcm.float() / (2**(bit_depth - 1))  
-    tensor_pcm = tensor_pcm.unsqueeze(0)  
-    torchaudio.save(buffer, tensor_pcm, sample_rate, format='wav')
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(num_channels)
+        wav_file.setsampwidth(sample_width)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm_data)
+    return buffer.getvalue()
+
+
+def convert_audio_to_wav_resampled(audio_bytes, target_sample_rate, source_format = 'mp3'):
+    # Decode and resample in one pass instead of exporting an intermediate WAV
+    # that then gets reparsed by resample()
+    audio = AudioSegment.from_file(io.BytesIO(audio_bytes), format=source_format)
+    if audio.frame_rate != target_sample_rate:
+        audio = audio.set_frame_rate(target_sample_rate)
+    if audio.channels != 1:
+        audio = audio.set_channels(1)
+    buffer = io.BytesIO()
+    audio.export(buffer, format="wav")
     return buffer.getvalue()
 
 
@@ -378,15 +394,39 @@ def convert_audio_to_wav(audio_bytes, source_format = 'flac'):
     return buffer.getvalue()
 
 
+@lru_cache(maxsize=8)
+def _resample_taps_f32(up, down):
+    # Same low-pass design resample_poly builds internally, but computed once per rate
+    # pair and cast to float32; upfirdn's result dtype follows the filter, so passing
+    # float32 taps (with float32 samples) keeps the whole filtering pass in float32
+    max_rate = max(up, down)
+    return firwin(2 * 10 * max_rate + 1, 1. / max_rate, window=('kaiser', 8.0)).astype(np.float32)
+
+
+def resample_pcm16(pcm_bytes, orig_sample_rate, target_sample_rate):
+    if orig_sample_rate == target_sample_rate:
+        return pcm_bytes
+    gcd = math.gcd(int(orig_sample_rate), int(target_sample_rate))
+    up, down = target_sample_rate // gcd, orig_sample_rate // gcd
+    if len(pcm_bytes) % 2 == 1:
+        pcm_bytes += b'\x00'
+    samples = np.frombuffer(pcm_bytes, dtype=np.int16)
+    resampled = resample_poly(samples.astype(np.float32), up, down, window=_resample_taps_f32(up, down))
+    np.clip(resampled, -32768.0, 32767.0, out=resampled)
+    return resampled.astype(np.int16).tobytes()
+
+
 def resample(audio_bytes, target_sample_rate, format = "mp3"):
     audio_buffer = io.BytesIO(audio_bytes)
     waveform, orig_sample_rate = torchaudio.load(audio_buffer, format = format)
     if orig_sample_rate == target_sample_rate:
         return audio_bytes
-    resampler = torchaudio.transforms.Resample(orig_sample_rate, target_sample_rate)
-    audio_waveform = resampler(waveform)
-    audio_buffer = io.BytesIO()
     logger.info(f"Resampling from {orig_sample_rate} to {target_sample_rate}")
+    gcd = math.gcd(int(orig_sample_rate), int(target_sample_rate))
+    resampled = resample_poly(waveform.numpy(), target_sample_rate // gcd, orig_sample_rate // gcd,
+                              axis=-1, window=('kaiser', 8.0))
+    audio_waveform = torch.from_numpy(np.ascontiguousarray(resampled, dtype=np.float32))
+    audio_buffer = io.BytesIO()
     torchaudio.save(audio_buffer, audio_waveform, target_sample_rate, format="wav")
     return audio_buffer.getvalue()
 
@@ -1 +1,2 @@
-from .inmemory_scalar_cache import InmemoryScalarCache
\ No newline at end of file
+from .inmemory_scalar_cache import InmemoryScalarCache
+from .inmemory_lru_cache import InmemoryLRUCache
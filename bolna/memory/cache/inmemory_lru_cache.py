@@ -0,0 +1,47 @@
+from collections import OrderedDict
+from .base_cache import BaseCache
+from bolna.helpers.logger_config import configure_logger
+
+logger = configure_logger(__name__)
+
+
+class InmemoryLRUCache(BaseCache):
+    def __init__(self, max_entries=200, max_size_bytes=50 * 1024 * 1024):
+        self.data_dict = OrderedDict()
+        self.size_dict = {}
+        self.total_size = 0
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+
+    @staticmethod
+    def __sizeof_value(value):
+        if isinstance(value, (bytes, bytearray)):
+            return len(value)
+        if isinstance(value, (list, tuple)):
+            return sum(len(chunk) for chunk in value)
+        return 0
+
+    def get(self, key):
+        if key in self.data_dict:
+            self.data_dict.move_to_end(key)
+            return self.data_dict[key]
+
+        logger.info(f"Cache miss for key {key}")
+        return None
+
+    def set(self, key, value):
+        if key in self.data_dict:
+            self.total_size -= self.size_dict[key]
+        self.data_dict[key] = value
+        self.data_dict.move_to_end(key)
+        self.size_dict[key] = self.__sizeof_value(value)
+        self.total_size += self.size_dict[key]
+        while self.data_dict and (len(self.data_dict) > self.max_entries or self.total_size > self.max_size_bytes):
+            evicted_key, _ = self.data_dict.popitem(last=False)
+            self.total_size -= self.size_dict.pop(evicted_key)
+            logger.info(f"Evicting LRU cache entry {evicted_key}")
+
+    def flush_cache(self):
+        self.data_dict.clear()
+        self.size_dict.clear()
+        self.total_size = 0
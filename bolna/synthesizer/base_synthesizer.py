@@ -6,6 +6,14 @@ import re
 
 logger = configure_logger(__name__)
 
+# Sentence boundary: whitespace after terminal punctuation, skipping common abbreviations.
+# Fixed-width lookbehinds only, so the scan is single-pass with no backtracking;
+# decimals like 3.5 never match because the dot is not followed by whitespace.
+SENTENCE_BOUNDARY_PATTERN = re.compile(
+    r'(?<=[.!?;:—])(?<!\bDr\.)(?<!\bMr\.)(?<!\bMs\.)(?<!\bSt\.)(?<!\bMrs\.)(?<!\bProf\.)\s+'
+)
+MIN_CHUNK_LENGTH = 10
+
 
 class BaseSynthesizer:
     def __init__(self, task_manager_instance=None, stream=True, buffer_size=40, event_loop=None):
@@ -48,18 +56,15 @@ class BaseSynthesizer:
         pass
 
     def text_chunker(self, text):
-        """Split text into chunks, ensuring to not break sentences."""
-        splitters = (".", ",", "?", "!", ";", ":", "—", "-", "(", ")", "[", "]", "}", " ")
-
+        """Split text into sentence chunks, keeping abbreviations and decimals intact."""
         buffer = ""
-        for char in text:
-            buffer += char
-            if char in splitters:
-                if buffer != " ":
-                    yield buffer.strip() + " "
+        for sentence in SENTENCE_BOUNDARY_PATTERN.split(text):
+            buffer = f"{buffer}{sentence} " if buffer else f"{sentence} "
+            if len(buffer.strip()) >= MIN_CHUNK_LENGTH:
+                yield buffer.strip() + " "
                 buffer = ""
 
-        if buffer:
+        if buffer.strip():
             yield buffer.strip() + " "
 
     def normalize_text(self, s):
@@ -1,19 +1,22 @@
 import asyncio
-import copy
+import hashlib
+import ssl
 import uuid
 import time
 import websockets
-import base64
+import binascii
 import json
 import aiohttp
 import os
 import traceback
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
+from bolna.memory.cache.inmemory_lru_cache import InmemoryLRUCache
 from bolna.memory.cache.inmemory_scalar_cache import InmemoryScalarCache
 from .base_synthesizer import BaseSynthesizer
 from bolna.helpers.logger_config import configure_logger
-from bolna.helpers.utils import convert_audio_to_wav, create_ws_data_packet, resample
+from bolna.helpers.utils import convert_audio_to_wav_resampled, create_ws_data_packet, pcm_to_wav_bytes, \
+    resample_pcm16, yield_chunks_from_memory
 
 logger = configure_logger(__name__)
 
@@ -31,27 +34,63 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
         self.speed = speed
         self.audio_format = "mp3"
         self.use_mulaw = kwargs.get("use_mulaw", True)
+        # ElevenLabs only serves pcm_16000/22050/24000; other configured rates (e.g. 8000 for
+        # linear16 telephony) fall back to 16 kHz over the wire and get resampled in generate()
+        self.ws_pcm_rate = int(self.sampling_rate) if int(self.sampling_rate) in (16000, 22050, 24000) else 16000
+        self.auto_mode = kwargs.get("auto_mode", True)
+        self.optimize_streaming_latency = kwargs.get("optimize_streaming_latency", 3)
+        self.apply_text_normalization = kwargs.get("apply_text_normalization", True)
         self.elevenlabs_host = os.getenv("ELEVENLABS_API_HOST", "api.elevenlabs.io")
-        self.ws_url = f"wss://{self.elevenlabs_host}/v1/text-to-speech/{self.voice}/multi-stream-input?model_id={self.model}&output_format={'ulaw_8000' if self.use_mulaw else 'mp3_44100_128'}&inactivity_timeout=170&sync_alignment=true"
-        self.api_url = f"https://{self.elevenlabs_host}/v1/text-to-speech/{self.voice}?optimize_streaming_latency=2&output_format="
+        self.ws_url = f"wss://{self.elevenlabs_host}/v1/text-to-speech/{self.voice}/multi-stream-input?model_id={self.model}&output_format={self.get_ws_output_format()}&auto_mode={str(self.auto_mode).lower()}&optimize_streaming_latency={self.optimize_streaming_latency}&inactivity_timeout=170&sync_alignment=true"
+        http_streaming_latency = self.optimize_streaming_latency if self.apply_text_normalization else 4
+        self.api_url = f"https://{self.elevenlabs_host}/v1/text-to-speech/{self.voice}?optimize_streaming_latency={http_streaming_latency}&output_format="
         self.first_chunk_generated = False
         self.last_text_sent = False
-        self.text_queue = deque()
+        self.text_queue = asyncio.Queue(maxsize=64)
         self.meta_info = None
         self.temperature = temperature
         self.similarity_boost = similarity_boost
         self.caching = caching
         if self.caching:
             self.cache = InmemoryScalarCache()
+            self.audio_cache = InmemoryLRUCache()
+        self.cache_frame_queue = asyncio.Queue()
+        self.pending_cache_key = None
+        # True from a push until generate() sees that turn's end marker; guards the cache
+        # accumulation against frames from two turns interleaving
+        self.synthesis_in_flight = False
+        # Reused across turns so the 50 Hz audio loop does not churn gen-0 allocations
+        self.current_cache_buffer = bytearray()
+        self.turn_texts = []
         self.synthesized_characters = 0
         self.previous_request_ids = []
+        # Single SSL context for the lifetime of the synthesizer so reconnects skip rebuilding
+        # the trust store. This does not enable TLS session resumption: that would require
+        # passing a captured SSLSession per connection, which websockets.connect() doesn't expose.
+        self.ssl_context = ssl.create_default_context()
         self.websocket_holder = {"websocket": None}
+        self._ws_ready = asyncio.Event()
+        self.sender_queue = asyncio.Queue()
+        self._http_session = None
+        # MP3 decode + resample release the GIL in their C internals, so run them off-loop
+        self._decode_pool = ThreadPoolExecutor(max_workers=2)
         self.sender_task = None
         self.conversation_ended = False
         self.current_turn_start_time = None
         self.current_turn_id = None
         self.current_text = ""
         self.context_id = None
+        # Pre-serialized frames for the WS hot path; the BOS payload and flush frame never change
+        self._bos_frame = json.dumps({
+            "text": " ",
+            "voice_settings": {
+                "stability": self.temperature,
+                "similarity_boost": self.similarity_boost,
+                "speed": self.speed
+            },
+            "xi_api_key": self.api_key
+        })
+        self._flush_frame = '{"text":"","flush":true}'
 
     # Ensuring we only do wav output for now
     def get_format(self, format, sampling_rate):
@@ -61,11 +100,25 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
             return "ulaw_8000"
         return f"mp3_44100_128"
 
+    def get_ws_output_format(self):
+        # Request raw PCM over the websocket so we never pay an MP3 decode + resample per chunk
+        if self.use_mulaw:
+            return "ulaw_8000"
+        return f"pcm_{self.ws_pcm_rate}"
+
     def get_engine(self):
         return self.model
 
+    def get_audio_cache_key(self, text):
+        key_material = f"{self.get_ws_output_format()}:{text}"
+        return hashlib.blake2b(key_material.encode('utf-8'), digest_size=16).digest()
+
     async def handle_interruption(self):
         try:
+            # A barge-in truncates the turn mid-stream; drop the partially accumulated
+            # audio so the final frame of the closed context can't commit it to the cache
+            self.pending_cache_key = None
+            self.current_cache_buffer.clear()
             if self.context_id:
                 interrupt_message = {
                     "context_id": self.context_id,
@@ -77,6 +130,27 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
         except Exception as e:
             pass
 
+    @staticmethod
+    def __encode_text_frame(text):
+        # Escape-free printable ASCII can be spliced straight into the frame, skipping
+        # the generic JSON encoder on the LLM->TTS hot path
+        if text.isascii() and text.isprintable() and '"' not in text and '\\' not in text:
+            return '{"text":"' + text + '"}'
+        return '{"text":' + json.dumps(text) + '}'
+
+    async def __send_text_frame(self, text_batch, sequence_id):
+        if not self.should_synthesize_response(sequence_id):
+            logger.info(
+                f"Not synthesizing text as the sequence_id ({sequence_id}) of it is not in the list of sequence_ids present in the task manager (inner loop).")
+            await self.flush_synthesizer_stream()
+            return False
+        try:
+            await self.websocket_holder["websocket"].send(self.__encode_text_frame(text_batch))
+        except Exception as e:
+            logger.info(f"Error sending chunk: {e}")
+            return False
+        return True
+
     async def sender(self, text, sequence_id, end_of_llm_stream=False):
         try:
             if self.conversation_ended:
@@ -91,20 +165,25 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
             # Ensure the WebSocket connection is established
             while self.websocket_holder["websocket"] is None or self.websocket_holder["websocket"].state is websockets.protocol.State.CLOSED:
                 logger.info("Waiting for elevenlabs ws connection to be established...")
-                await asyncio.sleep(1)
+                self._ws_ready.clear()
+                await self._ws_ready.wait()
 
             if text != "":
+                # Aggregate consecutive chunks into ~200-char frames; the full text is already
+                # in hand, so one frame per batch collapses N sends into one without delaying anything
+                pending_chunks = []
+                pending_length = 0
                 for text_chunk in self.text_chunker(text):
-                    if not self.should_synthesize_response(sequence_id):
-                        logger.info(
-                            f"Not synthesizing text as the sequence_id ({sequence_id}) of it is not in the list of sequence_ids present in the task manager (inner loop).")
-                        await self.flush_synthesizer_stream()
-                        return
-                    try:
-                        await self.websocket_holder["websocket"].send(json.dumps({"text": text_chunk}))
-                    except Exception as e:
-                        logger.info(f"Error sending chunk: {e}")
+                    pending_chunks.append(text_chunk)
+                    pending_length += len(text_chunk)
+                    if pending_length < 200:
+                        continue
+                    if not await self.__send_text_frame(''.join(pending_chunks), sequence_id):
                         return
+                    pending_chunks = []
+                    pending_length = 0
+                if pending_chunks and not await self.__send_text_frame(''.join(pending_chunks), sequence_id):
+                    return
 
             # If end_of_llm_stream is True, mark the last chunk and send an empty message
             if end_of_llm_stream:
@@ -113,15 +192,29 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
 
             # Send the end-of-stream signal with an empty string as text
             try:
-                await self.websocket_holder["websocket"].send(json.dumps({"text": "", "flush": True}))
+                await self.websocket_holder["websocket"].send(self._flush_frame)
             except Exception as e:
                 logger.info(f"Error sending end-of-stream signal: {e}")
 
         except asyncio.CancelledError:
+            # Must propagate so sender_loop (and cleanup awaiting it) actually stops;
+            # swallowing it here would send the loop back to a queue get that never returns
             logger.info("Sender task was cancelled.")
+            raise
         except Exception as e:
             logger.error(f"Unexpected error in sender: {e}")
 
+    async def sender_loop(self):
+        # One long-lived task draining the sender queue instead of a new Task per push
+        while True:
+            text, sequence_id, end_of_llm_stream = await self.sender_queue.get()
+            try:
+                await self.sender(text, sequence_id, end_of_llm_stream)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error in sender loop: {e}")
+
     async def receiver(self):
         while True:
             try:
@@ -130,8 +223,9 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
 
                 if (self.websocket_holder["websocket"] is None or
                         self.websocket_holder["websocket"].state is websockets.protocol.State.CLOSED):
-                    logger.info("WebSocket is not connected, skipping receive.")
-                    await asyncio.sleep(5)
+                    logger.info("WebSocket is not connected, waiting for it to be re-established.")
+                    self._ws_ready.clear()
+                    await self._ws_ready.wait()
                     continue
 
                 response = await self.websocket_holder["websocket"].recv()
@@ -140,7 +234,9 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
                 # logger.info(f"Response from elevenlabs - {data}")
 
                 if "audio" in data and data["audio"]:
-                    chunk = base64.b64decode(data["audio"])
+                    # binascii.a2b_base64 is the C decoder underneath base64.b64decode minus
+                    # the alt-charset translation pass, so it saves a copy per audio frame
+                    chunk = binascii.a2b_base64(data["audio"])
                     try:
                         text_spoken = ''.join(data.get('alignment', {}).get('chars', []))
                     except Exception as e:
@@ -179,21 +275,53 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
             except Exception as e:
                 logger.error(f"Error occurred in receiver - {e}")
 
+    async def frame_source(self):
+        # Merge frames coming off the websocket with cached replays so cache hits
+        # never touch the network
+        receiver_gen = self.receiver()
+        receiver_next = asyncio.ensure_future(receiver_gen.__anext__())
+        cache_next = asyncio.ensure_future(self.cache_frame_queue.get())
+        try:
+            while True:
+                done, _ = await asyncio.wait({receiver_next, cache_next}, return_when=asyncio.FIRST_COMPLETED)
+                if cache_next in done:
+                    yield cache_next.result()
+                    cache_next = asyncio.ensure_future(self.cache_frame_queue.get())
+                if receiver_next in done:
+                    try:
+                        yield receiver_next.result()
+                    except StopAsyncIteration:
+                        return
+                    receiver_next = asyncio.ensure_future(receiver_gen.__anext__())
+        finally:
+            for task in (receiver_next, cache_next):
+                if not task.done():
+                    task.cancel()
+
+    def __get_http_session(self):
+        # One session (and hence one keep-alive HTTPS connection pool) for all REST synth
+        # calls, so only the first request pays DNS + TCP + TLS setup
+        if self._http_session is None or self._http_session.closed:
+            connector = aiohttp.TCPConnector(limit=8, ttl_dns_cache=300, keepalive_timeout=60,
+                                             enable_cleanup_closed=True)
+            self._http_session = aiohttp.ClientSession(connector=connector)
+        return self._http_session
+
     async def __send_payload(self, payload, format=None):
         headers = {
             'xi-api-key': self.api_key
         }
         url = f"{self.api_url}{self.get_format(self.audio_format, self.sampling_rate)}" if format is None else f"{self.api_url}{format}"
-        async with aiohttp.ClientSession() as session:
-            if payload is not None:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    if response.status == 200:
-                        data = await response.read()
-                        return data
-                    else:
-                        logger.error(f"Error: {response.status} - {await response.text()}")
-            else:
-                logger.info("Payload was null")
+        if payload is not None:
+            session = self.__get_http_session()
+            async with session.post(url, headers=headers, json=payload) as response:
+                if response.status == 200:
+                    data = await response.read()
+                    return data
+                else:
+                    logger.error(f"Error: {response.status} - {await response.text()}")
+        else:
+            logger.info("Payload was null")
 
     async def synthesize(self, text):
         audio = await self.__generate_http(text, format="mp3_44100_128")
@@ -215,6 +343,9 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
         response = await self.__send_payload(payload, format=format)
         return response
 
+    def __decode_and_resample(self, audio):
+        return convert_audio_to_wav_resampled(audio, int(self.sampling_rate), source_format="mp3")
+
     def get_synthesized_characters(self):
         return self.synthesized_characters
 
@@ -222,11 +353,11 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
     async def generate(self):
         try:
             if self.stream:
-                async for message, text_synthesized in self.receiver():
+                async for message, text_synthesized in self.frame_source():
                     logger.info(f"Received message from server")
 
-                    if len(self.text_queue) > 0:
-                        self.meta_info = self.text_queue.popleft()
+                    if not self.text_queue.empty():
+                        self.meta_info = self.text_queue.get_nowait()
                         # Compute first-result latency on first audio chunk
                         try:
                             if self.current_turn_start_time is not None:
@@ -243,8 +374,11 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
                         self.meta_info['format'] = "wav"
                         audio = message
                         if message != b'\x00':
-                            audio = resample(convert_audio_to_wav(message, source_format="mp3"), int(self.sampling_rate),
-                                             format="wav")
+                            pcm = message
+                            if self.ws_pcm_rate != int(self.sampling_rate):
+                                # Wire rate fell back to 16 kHz; bring it down to the configured rate
+                                pcm = resample_pcm16(pcm, self.ws_pcm_rate, int(self.sampling_rate))
+                            audio = pcm_to_wav_bytes(pcm, sample_rate=int(self.sampling_rate))
 
                     if not self.first_chunk_generated:
                         self.meta_info["is_first_chunk"] = True
@@ -276,6 +410,18 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
                         except Exception:
                             pass
 
+                    if message == b'\x00':
+                        self.synthesis_in_flight = False
+
+                    if self.caching:
+                        if message == b'\x00':
+                            if self.pending_cache_key is not None and self.current_cache_buffer:
+                                self.audio_cache.set(self.pending_cache_key, bytes(self.current_cache_buffer))
+                            self.pending_cache_key = None
+                            self.current_cache_buffer.clear()
+                        elif self.pending_cache_key is not None:
+                            self.current_cache_buffer.extend(message)
+
                     self.meta_info["text_synthesized"] = text_synthesized
 
                     self.meta_info["mark_id"] = str(uuid.uuid4())
@@ -316,9 +462,9 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
                         meta_info['format'] = "mulaw"
                     else:
                         meta_info['format'] = "wav"
-                        wav_bytes = convert_audio_to_wav(audio, source_format="mp3")
                         logger.info(f"self.sampling_rate {self.sampling_rate}")
-                        audio = resample(wav_bytes, int(self.sampling_rate), format="wav")
+                        audio = await asyncio.get_running_loop().run_in_executor(
+                            self._decode_pool, self.__decode_and_resample, audio)
                     yield create_ws_data_packet(audio, meta_info)
 
         except Exception as e:
@@ -331,17 +477,8 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
     async def establish_connection(self):
         try:
             start_time = time.perf_counter()
-            websocket = await websockets.connect(self.ws_url)
-            bos_message = {
-                "text": " ",
-                "voice_settings": {
-                    "stability": self.temperature,
-                    "similarity_boost": self.similarity_boost,
-                    "speed": self.speed
-                },
-                "xi_api_key": self.api_key
-            }
-            await websocket.send(json.dumps(bos_message))
+            websocket = await websockets.connect(self.ws_url, ssl=self.ssl_context, open_timeout=10)
+            await websocket.send(self._bos_frame)
             if not self.connection_time:
                 self.connection_time = round((time.perf_counter() - start_time) * 1000)
 
@@ -356,7 +493,10 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
         while True:
             if self.websocket_holder["websocket"] is None or self.websocket_holder["websocket"].state is websockets.protocol.State.CLOSED:
                 logger.info("Re-establishing elevenlabs connection...")
+                self._ws_ready.clear()
                 self.websocket_holder["websocket"] = await self.establish_connection()
+                if self.websocket_holder["websocket"] is not None:
+                    self._ws_ready.set()
             await asyncio.sleep(1)
 
     async def get_sender_task(self):
@@ -365,9 +505,9 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
     async def push(self, message):
         if self.stream:
             meta_info, text, self.current_text = message.get("meta_info"), message.get("data"), message.get("data")
-            self.synthesized_characters += len(text) if text is not None else 0
             end_of_llm_stream = "end_of_llm_stream" in meta_info and meta_info["end_of_llm_stream"]
-            self.meta_info = copy.deepcopy(meta_info)
+            # meta_info is a flat dict of scalars; a shallow copy is enough and avoids deepcopy overhead per push
+            self.meta_info = dict(meta_info)
             meta_info["text"] = text
             # Stamp synthesizer turn start time
             try:
@@ -375,10 +515,41 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
                 self.current_turn_id = meta_info.get('turn_id') or meta_info.get('sequence_id')
             except Exception:
                 pass
+
+            # Only single-push turns (greetings, fillers, disclaimers) are cacheable since their
+            # full text is known upfront
+            single_push_turn = end_of_llm_stream and not self.turn_texts and text
+            if end_of_llm_stream:
+                self.turn_texts = []
+            else:
+                self.turn_texts.append(text or "")
+            if self.caching and self.pending_cache_key is not None:
+                # A new turn is starting before the previous accumulation committed, so the
+                # buffer can no longer be attributed to one turn; abandon it rather than
+                # risk storing mixed audio under the wrong key
+                self.pending_cache_key = None
+                self.current_cache_buffer.clear()
+            if self.caching and single_push_turn and not self.synthesis_in_flight:
+                cached_audio = self.audio_cache.get(self.get_audio_cache_key(text))
+                if cached_audio is not None:
+                    logger.info(f"Audio cache hit, replaying synthesized audio for: {text}")
+                    meta_info['is_cached'] = True
+                    self.synthesis_in_flight = True
+                    await self.text_queue.put(meta_info)
+                    for chunk in yield_chunks_from_memory(cached_audio, chunk_size=4096):
+                        self.cache_frame_queue.put_nowait((chunk, ""))
+                    self.cache_frame_queue.put_nowait((b'\x00', ""))
+                    return
+                self.pending_cache_key = self.get_audio_cache_key(text)
+
+            self.synthesis_in_flight = True
+            self.synthesized_characters += len(text) if text is not None else 0
             if not self.context_id:
                 self.context_id = str(uuid.uuid4())
-            self.sender_task = asyncio.create_task(self.sender(text, meta_info.get("sequence_id"), end_of_llm_stream))
-            self.text_queue.append(meta_info)
+            if self.sender_task is None:
+                self.sender_task = asyncio.create_task(self.sender_loop())
+            self.sender_queue.put_nowait((text, meta_info.get("sequence_id"), end_of_llm_stream))
+            await self.text_queue.put(meta_info)
         else:
             self.internal_queue.put_nowait(message)
 
@@ -395,4 +566,7 @@ class ElevenlabsSynthesizer(BaseSynthesizer):
         if self.websocket_holder["websocket"]:
             await self.websocket_holder["websocket"].close()
         self.websocket_holder["websocket"] = None
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._decode_pool.shutdown(wait=False)
         logger.info("WebSocket connection closed.")
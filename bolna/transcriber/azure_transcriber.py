@@ -12,6 +12,15 @@ from bolna.helpers.logger_config import configure_logger
 logger = configure_logger(__name__)
 load_dotenv()
 
+# (sampling_rate, encoding, bits_per_sample) per telephony provider
+_PROVIDER_AUDIO_PROFILES = {
+    "twilio": (8000, "mulaw", 8),
+    "exotel": (8000, "linear16", 16),
+    "plivo": (8000, "linear16", 16),
+    "web_based_call": (16000, "linear16", 16)
+}
+_DEFAULT_AUDIO_PROFILE = (8000, "linear16", 16)
+
 
 class AzureTranscriber(BaseTranscriber):
     def __init__(self, telephony_provider, input_queue=None, output_queue=None, language="en-US", encoding="linear16", **kwargs):
@@ -28,22 +37,14 @@ class AzureTranscriber(BaseTranscriber):
         self.recognition_language = language
         self.audio_provider = telephony_provider
         self.channels = 1
-        self.encoding = "linear16"
-        self.sampling_rate = 8000
-        self.bits_per_sample = 16
+        self.sampling_rate, self.encoding, self.bits_per_sample = _PROVIDER_AUDIO_PROFILES.get(
+            self.audio_provider, _DEFAULT_AUDIO_PROFILE)
+        self.wave_stream_format = AudioStreamWaveFormat.MULAW if self.encoding == "mulaw" else AudioStreamWaveFormat.PCM
         self.run_id = kwargs.get("run_id", "")
         self.duration = 0
         self.start_time = None
         self.end_time = None
 
-        if self.audio_provider in ("twilio", "exotel", "plivo"):
-            self.encoding = "mulaw" if self.audio_provider in ("twilio",) else "linear16"
-            if self.encoding == "mulaw":
-                self.bits_per_sample = 8
-
-        elif self.audio_provider == "web_based_call":
-            self.sampling_rate = 16000
-
         # Store the event loop to use in the handlers
         self.loop = asyncio.get_event_loop()
 
@@ -63,8 +64,21 @@ class AzureTranscriber(BaseTranscriber):
 
     async def send_audio_to_transcriber(self):
         try:
+            # Batch packets before crossing into the Azure SDK; flushing at ~200 ms worth of
+            # audio (scaled by the profile's byte rate, e.g. 1600 bytes for 8-bit mulaw at
+            # 8 kHz) stays well under the recognizer's own buffering while cutting the
+            # Python->native write crossings by roughly 10x
+            audio_buffer = bytearray()
+            bytes_per_second = self.sampling_rate * self.bits_per_sample // 8
+            flush_threshold = bytes_per_second // 5
             while True:
-                ws_data_packet = await self.input_queue.get()
+                try:
+                    ws_data_packet = await asyncio.wait_for(self.input_queue.get(), timeout=0.02)
+                except asyncio.TimeoutError:
+                    if audio_buffer and self.push_stream:
+                        self.push_stream.write(bytes(audio_buffer))
+                        audio_buffer.clear()
+                    continue
                 if not self.audio_submitted:
                     self.meta_info = ws_data_packet.get('meta_info')
                     self.audio_submitted = True
@@ -76,12 +90,19 @@ class AzureTranscriber(BaseTranscriber):
                     except Exception:
                         pass
 
+                if ws_data_packet.get('meta_info', {}).get('eos') is True and audio_buffer and self.push_stream:
+                    # Flush whatever is pending before cleanup closes the push stream
+                    self.push_stream.write(bytes(audio_buffer))
+                    audio_buffer.clear()
                 end_of_stream = self._check_and_process_end_of_stream(ws_data_packet)
                 if end_of_stream:
                     break
                 # logger.info(f"Sending audio packet to Azure - {ws_data_packet.get('data')}")
                 if ws_data_packet.get('data'):
-                    self.push_stream.write(ws_data_packet.get('data'))
+                    audio_buffer.extend(ws_data_packet.get('data'))
+                    if len(audio_buffer) >= flush_threshold:
+                        self.push_stream.write(bytes(audio_buffer))
+                        audio_buffer.clear()
         except Exception as e:
             exc_type, exc_obj, exc_tb = sys.exc_info()
             logger.error(f"Error occurred in send_audio_to_transcriber - {e} at {exc_tb.tb_lineno}")
@@ -99,7 +120,7 @@ class AzureTranscriber(BaseTranscriber):
                 bits_per_sample=self.bits_per_sample,
                 channels=self.channels,
                 compressed_stream_format=None,
-                wave_stream_format=AudioStreamWaveFormat.MULAW if self.encoding == "mulaw" else AudioStreamWaveFormat.PCM
+                wave_stream_format=self.wave_stream_format
             )
 
             # Create a PushAudioInputStream – this lets you push audio packets to the recognizer.
@@ -112,11 +133,11 @@ class AzureTranscriber(BaseTranscriber):
             self.recognizer = speechsdk.SpeechRecognizer(speech_config=speech_config, audio_config=audio_config)
 
             # Connect event handlers to the recognizer
-            self.recognizer.recognizing.connect(self._sync_recognizing_handler)
-            self.recognizer.recognized.connect(self._sync_recognized_handler)
-            self.recognizer.canceled.connect(self._sync_canceled_handler)
-            self.recognizer.session_started.connect(self._sync_session_started_handler)
-            self.recognizer.session_stopped.connect(self._sync_session_stopped_handler)
+            self.recognizer.recognizing.connect(self.recognizing_handler)
+            self.recognizer.recognized.connect(self.recognized_handler)
+            self.recognizer.canceled.connect(self.canceled_handler)
+            self.recognizer.session_started.connect(self.session_started_handler)
+            self.recognizer.session_stopped.connect(self.session_stopped_handler)
 
             # Start continuous recognition asynchronously (blocking until it starts)
             start_time = time.perf_counter()
@@ -128,24 +149,13 @@ class AzureTranscriber(BaseTranscriber):
         except Exception as e:
             logger.error(f"Error in initialize_connection - {e}")
 
-    # Synchronous wrapper functions that schedule the async handlers
-    def _sync_recognizing_handler(self, evt):
-        asyncio.run_coroutine_threadsafe(self.recognizing_handler(evt), self.loop)
-
-    def _sync_recognized_handler(self, evt):
-        asyncio.run_coroutine_threadsafe(self.recognized_handler(evt), self.loop)
-
-    def _sync_canceled_handler(self, evt):
-        asyncio.run_coroutine_threadsafe(self.canceled_handler(evt), self.loop)
-
-    def _sync_session_started_handler(self, evt):
-        asyncio.run_coroutine_threadsafe(self.session_started_handler(evt), self.loop)
-
-    def _sync_session_stopped_handler(self, evt):
-        asyncio.run_coroutine_threadsafe(self.session_stopped_handler(evt), self.loop)
+    def __dispatch_packet(self, packet):
+        # Handlers run on the Azure SDK thread; call_soon_threadsafe hands the already-built
+        # packet to the loop without allocating a Future per event like run_coroutine_threadsafe
+        self.loop.call_soon_threadsafe(self.transcriber_output_queue.put_nowait, packet)
 
-    # Async handlers
-    async def recognizing_handler(self, evt):
+    # Handlers below are invoked synchronously from the Azure SDK's callback thread
+    def recognizing_handler(self, evt):
         logger.info(f"Intermediate results: {evt.result.text} | run_id - {self.run_id}")
         if evt.result.text.strip():
             data = {
@@ -157,9 +167,9 @@ class AzureTranscriber(BaseTranscriber):
                     self.meta_info['transcriber_first_result_latency'] = time.perf_counter() - self.meta_info['transcriber_start_time']
             except Exception:
                 pass
-            await self.transcriber_output_queue.put(create_ws_data_packet(data, self.meta_info))
+            self.__dispatch_packet(create_ws_data_packet(data, self.meta_info))
 
-    async def recognized_handler(self, evt):
+    def recognized_handler(self, evt):
         # Final recognized text for an utterance.
         logger.info(f"Final transcript: {evt.result.text} | run_id - {self.run_id}")
         if evt.result.text.strip():
@@ -172,23 +182,22 @@ class AzureTranscriber(BaseTranscriber):
                     self.meta_info['transcriber_total_stream_duration'] = time.perf_counter() - self.meta_info['transcriber_start_time']
             except Exception:
                 pass
-            await self.transcriber_output_queue.put(create_ws_data_packet(data, self.meta_info))
+            self.__dispatch_packet(create_ws_data_packet(data, self.meta_info))
             self.duration += evt.result.duration
 
-    async def canceled_handler(self, evt):
+    def canceled_handler(self, evt):
         logger.info(f"Canceled event received: {evt} | run_id - {self.run_id}")
 
-    async def session_started_handler(self, evt):
+    def session_started_handler(self, evt):
         logger.info(f"Session start event received: {evt} | run_id - {self.run_id}")
         self.start_time = time.time()
 
-    async def session_stopped_handler(self, evt):
+    def session_stopped_handler(self, evt):
         logger.info(f"Session stop event received: {evt} | run_id - {self.run_id}")
         # TODO add the code for getting transcript duration for billing
         self.end_time = time.time()
         self.meta_info["transcriber_duration"] = self.end_time - self.start_time
-        await self.transcriber_output_queue.put(
-            create_ws_data_packet("transcriber_connection_closed", self.meta_info))
+        self.__dispatch_packet(create_ws_data_packet("transcriber_connection_closed", self.meta_info))
 
     async def toggle_connection(self):
         self.connection_on = False